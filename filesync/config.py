@@ -12,10 +12,71 @@ except ImportError:
     DEFAULT_SRC_DIR = None
     IGNORED_DIRS = []
 
-HASH_CHUNK_SIZE = 8192
+# Set lookups keep directory pruning O(1) per entry during scans
+IGNORED_DIRS = frozenset(IGNORED_DIRS)
+
+IGNORE_HIDDEN_DIRS = False
+"""
+If True, directories whose names start with a dot (e.g. `.git`) are skipped
+during scans, in addition to those listed in `IGNORED_DIRS`. Disabled by
+default so hidden directories are still backed up.
+"""
+
+HASH_ALGO = os.environ.get("FILESYNC_HASH", "sha256")
+"""
+Hash algorithm used to fingerprint files, set through the `FILESYNC_HASH`
+environment variable. Either "sha256" (default) or "blake3". BLAKE3 hashes
+a file as a tree across SIMD lanes and threads, which is several times
+faster than SHA-256, but requires the optional `blake3` package. The
+algorithm is recorded in the hash databases; databases built with another
+algorithm are discarded and rebuilt.
+
+SHA-256 is fastest when `hashlib` is backed by OpenSSL, which uses SHA-NI on
+x86 (unless masked out through `OPENSSL_ia32cap`) and the ARMv8 Crypto
+Extensions on builds compiled with `-DUSE_ARMV8_CRYPTO`. A warning is logged
+when `hashlib` is not backed by OpenSSL.
+"""
+
+HASH_CHUNK_SIZE = 1 << 20
 """
 Size of the chunks (in bytes) to read from files when computing a hash.
-A larger chunk size can speed up hashing for large files.
+A larger chunk size can speed up hashing for large files. 1 MiB is a
+multiple of the page size and keeps the number of read syscalls low.
+"""
+
+HASH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+"""
+Number of worker threads used to hash files in parallel during a scan.
+Hashing releases the GIL while reading and digesting, so threads overlap
+both disk I/O and the hash computation itself.
+"""
+
+COPY_WORKERS = 8
+"""
+Number of worker threads used to copy new and modified files during a sync.
+Copies are mostly blocking I/O, so running several at once keeps the disk
+queue busy, which matters most when syncing many small files.
+"""
+
+QUICK_CHECK = False
+"""
+Default for the `--quick-check` option. If True, a file without a valid
+cached hash on one side is assumed to be identical to its counterpart on the
+other side when both have the same size and modification time (copies
+preserve modification times). It then reuses the other side's hash, or only
+one of the two copies is hashed. Files whose contents differ but whose size
+and modification time happen to match are NOT detected, so this is off by
+default and every such file is hashed.
+"""
+
+APPEND_ONLY_SUFFIXES = ()
+"""
+File name suffixes (e.g. `(".log",)`) of files that are only ever appended
+to. These files are hashed in blocks of `HASH_CHUNK_SIZE` bytes and the
+per-block digests are kept in the hash database, so a rescan only reads the
+data appended since the previous one. Changes made in place to the already
+hashed part of such a file are NOT detected, so only list suffixes of files
+that are never edited in place.
 """
 
 HASH_DB_FILENAME = ".syncdb.json"
@@ -5,19 +5,237 @@ comparing files, and performing synchronization actions.
 """
 
 import os
+import sys
+import errno
 import shutil
 import hashlib
 import json
-from .config import Colors, HASH_CHUNK_SIZE, HASH_DB_FILENAME, IGNORED_DIRS
+import mmap
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .config import (Colors, APPEND_ONLY_SUFFIXES, COPY_WORKERS, HASH_ALGO, HASH_CHUNK_SIZE,
+                     HASH_DB_FILENAME, HASH_WORKERS, IGNORED_DIRS, IGNORE_HIDDEN_DIRS,
+                     QUICK_CHECK)
+
+try:
+    import orjson  # Optional, much faster (de)serialization of the hash DBs
+except ImportError:
+    orjson = None
+
+try:
+    import blake3  # Optional, used when HASH_ALGO is "blake3"
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+try:
+    import _hashlib  # OpenSSL bindings behind hashlib
+    HAS_OPENSSL = True
+except ImportError:
+    HAS_OPENSSL = False
+
+
+def _new_hasher():
+    """
+    Returns a new hash object for the configured `HASH_ALGO`.
+
+    BLAKE3 hashers may use all cores. For SHA-256 the OpenSSL implementation
+    from `hashlib` is preferred: OpenSSL picks SHA-NI (x86, see
+    `OPENSSL_ia32cap`) or the ARMv8 Crypto Extensions (builds with
+    `-DUSE_ARMV8_CRYPTO`) at runtime, which is several times faster than the
+    portable implementation Python falls back to without OpenSSL.
+    `usedforsecurity=False` keeps FIPS-restricted builds on the accelerated
+    OpenSSL path, since the hash is only used as a file fingerprint.
+    """
+    if HASH_ALGO == 'blake3':
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return hashlib.new(HASH_ALGO, usedforsecurity=False)
+
+
+def _json_dumps(obj):
+    """
+    Serializes an object to compact JSON bytes, with `orjson` when installed.
+
+    `orjson` rejects strings with lone surrogates, which `os.scandir` yields
+    for non-UTF-8 file names on POSIX; those objects go through the stdlib
+    `json` module, which escapes them.
+    """
+    if orjson:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _json_loads(data):
+    """
+    Parses JSON bytes, with `orjson` when installed.
+
+    Falls back to the stdlib `json` module for input `orjson` rejects, such as
+    the surrogate escapes `_json_dumps` writes for non-UTF-8 file names.
+    """
+    if orjson:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass
+    return json.loads(data)
+
+
+def _read_db_records(lines):
+    """
+    Yields `(rel_path, entry)` pairs from the record lines of a JSON Lines DB.
+
+    Blank lines are skipped. Raises ValueError for a record that is not a
+    JSON object, so that `load_hash_db` treats the database as corrupted.
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        record = _json_loads(line)
+        if not isinstance(record, dict):
+            raise ValueError("DB record is not a JSON object")
+        yield record.pop('path'), record
+
+
+def _db_entry(entry):
+    """
+    Validates a loaded hash DB entry and returns it in the current schema.
+
+    Bare hash strings, as stored by the oldest DBs, become entries with an
+    unknown modification time and size. Raises ValueError for an entry that
+    lacks `hash`, `mtime_ns` or `size`, or has only one of `block_size` and
+    `block_hashes`.
+    """
+    if isinstance(entry, str):
+        return {'mtime_ns': None, 'size': None, 'hash': entry}
+    if (not isinstance(entry, dict) or not {'hash', 'mtime_ns', 'size'} <= entry.keys()
+            or ('block_size' in entry) != ('block_hashes' in entry)):
+        raise ValueError("Malformed DB entry")
+    return entry
+
+
+def _merkle_root(block_hashes):
+    """
+    Combines per-block digests into a single file hash.
+
+    The root is the hash of the concatenated raw block digests.
+    """
+    root = _new_hasher()
+    for block_hash in block_hashes:
+        root.update(bytes.fromhex(block_hash))
+    return root.hexdigest()
+
+
+def _read_chunks_pipelined(f, chunk_size):
+    """
+    Yields successive chunks of a binary file while a background thread reads ahead.
+
+    Two buffers alternate between the reader thread and the caller, so the
+    next read overlaps with whatever the caller does with the current chunk
+    (file reads and `hashlib` updates both release the GIL). Each yielded
+    memoryview is only valid until the next chunk is requested.
+    """
+    free, filled = queue.Queue(), queue.Queue()
+    for _ in range(2):
+        free.put(memoryview(bytearray(chunk_size)))
+
+    def reader():
+        try:
+            while (buf := free.get()) is not None:
+                n = f.readinto(buf)
+                filled.put((buf, n))
+                if not n:
+                    return
+        except Exception as e:
+            filled.put((None, e))
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    try:
+        while True:
+            buf, n = filled.get()
+            if buf is None:
+                raise n
+            if not n:
+                return
+            yield buf[:n]
+            free.put(buf)
+    finally:
+        free.put(None)  # Stop the reader if the caller bailed out early
+        thread.join()
+
+
+def _copy_hash(src_info, dest_info):
+    """
+    Copies the hash (and block hashes, if any) of one scanned file entry to another.
+    """
+    dest_info['hash'] = src_info['hash']
+    if 'block_hashes' in src_info:
+        dest_info['block_size'] = src_info['block_size']
+        dest_info['block_hashes'] = src_info['block_hashes']
+
+
+# errno values meaning a kernel copy primitive can't handle this pair of files
+_COPY_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.ENOTSOCK,
+                     errno.EOPNOTSUPP, errno.ENOTSUP}
+
+
+def _kernel_copy(copy, src_fd, dest_fd, size):
+    """
+    Copies from the current offset of `src_fd` to EOF with a kernel copy primitive.
+
+    `copy(src_fd, dest_fd, count)` must advance both file offsets and return
+    the number of bytes copied. Returns False if the primitive is unsupported
+    for these files, or stopped before `size` bytes (some filesystems report
+    EOF early); the file offsets then show where a fallback must resume.
+    """
+    try:
+        while copy(src_fd, dest_fd, 1 << 30):
+            pass
+    except OSError as e:
+        if e.errno in _COPY_UNSUPPORTED:
+            return False
+        raise
+    return os.lseek(src_fd, 0, os.SEEK_CUR) >= size
+
+
+def _fast_copy(src_path, dest_path):
+    """
+    Copies a file's contents and metadata like `shutil.copy2`, without user-space buffers.
+
+    `os.copy_file_range` is tried first (it can share extents or copy
+    server-side where the filesystem supports it), then `os.sendfile` (Linux
+    only: other platforms require an explicit offset and, on macOS, a socket
+    as the destination). Both move the data inside the kernel. If neither
+    works for this pair of files, the remaining data is copied with
+    `shutil.copyfileobj`.
+    """
+    with open(src_path, 'rb', buffering=0) as fsrc, open(dest_path, 'wb', buffering=0) as fdst:
+        src_fd, dest_fd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(src_fd).st_size
+        copied = (hasattr(os, 'copy_file_range')
+                  and _kernel_copy(os.copy_file_range, src_fd, dest_fd, size))
+        if not copied and sys.platform.startswith('linux'):
+            copied = _kernel_copy(lambda src, dest, count: os.sendfile(dest, src, None, count),
+                                  src_fd, dest_fd, size)
+        if not copied:
+            shutil.copyfileobj(fsrc, fdst, HASH_CHUNK_SIZE)
+    shutil.copystat(src_path, dest_path)
+
 
 # === FileSync Class ===
 class FileSync:
     """
     Synchronizes files between a source and destination directory using a hash-based approach.
 
-    The tool maintains a small JSON database (`.syncdb.json`) in each directory to
-    store file hashes. This allows for quick detection of new, modified, or
-    deleted files without re-hashing everything on subsequent runs.
+    The tool maintains a JSON Lines database (`.syncdb.json`) in each directory:
+    a header line recording the hash algorithm, followed by one record per file
+    with its hash and the modification time and size it was computed for. This
+    allows for quick detection of new, modified, or deleted files without
+    re-hashing unchanged files on subsequent runs.
 
     Parameters
     ----------
@@ -38,6 +256,22 @@ class FileSync:
         If True, the tool will only perform a scan and print a summary of
         changes without performing any file operations (copying, deleting).
         Defaults to False.
+    trust_db : bool, optional
+        If True, files listed in the destination's (backup's) hash database
+        are assumed unchanged and are not even stat'ed during scans. Only
+        safe if nothing but this tool writes to the destination.
+        Defaults to False.
+    quick_check : bool, optional
+        If True, files without a valid cached hash are assumed identical to
+        their counterpart when size and modification time match on both
+        sides, instead of being hashed (see `apply_quick_check`). Defaults
+        to `QUICK_CHECK`.
+
+    Raises
+    ------
+    ValueError
+        If `HASH_ALGO` is not "sha256" or "blake3", or is "blake3" while the
+        `blake3` package is not installed.
 
     Attributes
     ----------
@@ -51,6 +285,10 @@ class FileSync:
         Flag for RESTORE mode.
     scan_only : bool
         Flag for scan-only mode.
+    trust_db : bool
+        Flag for trusting the destination's hash database.
+    quick_check : bool
+        Flag for the size and modification time quick check.
     src_db_path : str
         Full path to the source's hash database file.
     dest_db_path : str
@@ -60,17 +298,34 @@ class FileSync:
     dest_hash_db : dict
         A dictionary loaded from the destination's hash database.
     """
-    def __init__(self, src_dir, dest_dir, verbosity=1, restore=False, scan_only=False):
+    def __init__(self, src_dir, dest_dir, verbosity=1, restore=False, scan_only=False,
+                 trust_db=False, quick_check=QUICK_CHECK):
+        # Fail early: a hasher that cannot be built would turn every hash into None
+        if HASH_ALGO not in ('sha256', 'blake3'):
+            raise ValueError(f"Unsupported hash algorithm in FILESYNC_HASH: {HASH_ALGO} "
+                             "(expected sha256 or blake3)")
+        if HASH_ALGO == 'blake3' and not HAS_BLAKE3:
+            raise ValueError("FILESYNC_HASH=blake3 requires the blake3 package "
+                             "(pip install blake3)")
+
         self.src_dir = src_dir
         self.dest_dir = dest_dir
         self.verbosity = verbosity
         self.restore = restore
         self.scan_only = scan_only
+        self.trust_db = trust_db
+        self.quick_check = quick_check
+        # Serializes console output from worker threads
+        self._log_lock = threading.Lock()
 
         # Each dir has its own hash DB
         self.src_db_path = os.path.join(self.src_dir, HASH_DB_FILENAME)
         self.dest_db_path = os.path.join(self.dest_dir, HASH_DB_FILENAME)
 
+        if HASH_ALGO == 'sha256' and not HAS_OPENSSL:
+            self.log("[!] hashlib is not backed by OpenSSL; SHA-256 hardware acceleration "
+                     "is unavailable.", 1, Colors.YELLOW)
+
         self.src_hash_db = self.load_hash_db(self.src_db_path)
         self.dest_hash_db = self.load_hash_db(self.dest_db_path)
 
@@ -89,14 +344,25 @@ class FileSync:
             The ANSI color code to apply to the message. Defaults to `Colors.RESET`.
         """
         if self.verbosity >= level:
-            print(f"{color}{msg}{Colors.RESET}")
+            with self._log_lock:
+                print(f"{color}{msg}{Colors.RESET}")
 
     def get_file_hash(self, path):
         """
-        Calculates the SHA-256 hash of a file.
+        Calculates the hash of a file using the configured `HASH_ALGO`.
 
-        The file is read in chunks to handle large files efficiently without
-        loading the entire file into memory.
+        With BLAKE3 the file is memory-mapped and hashed by the `blake3`
+        package itself, which splits the work across threads.
+
+        For SHA-256, files larger than `4 * HASH_CHUNK_SIZE` are memory-mapped and hashed
+        straight from the page cache, avoiding a copy into user space. If a
+        large file cannot be mapped, it is read in chunks on a background
+        thread so that reads overlap with hashing. Files smaller than
+        `HASH_CHUNK_SIZE` are read with a single exact-size `os.read`, keeping
+        the per-file cost of scanning many small files down to
+        open/fstat/read/close. Everything in between is read in chunks to
+        avoid loading the entire file into memory; on Python 3.11+ the
+        read/update loop runs in C via `hashlib.file_digest`.
 
         Parameters
         ----------
@@ -109,19 +375,136 @@ class FileSync:
             The hexadecimal representation of the file's hash, or None if an
             error occurred (e.g., file not found or permission denied).
         """
-        sha256 = hashlib.sha256()
         try:
+            if HASH_ALGO == 'blake3':
+                hasher = _new_hasher()
+                hasher.update_mmap(path)
+                return hasher.hexdigest()
+
+            with open(path, 'rb', buffering=0) as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < HASH_CHUNK_SIZE:
+                    # Ask for one byte more than expected: a short read means EOF,
+                    # so unchanged small files need no extra read to detect it
+                    hasher = _new_hasher()
+                    read, update, fd = os.read, hasher.update, f.fileno()
+                    n = size + 1
+                    while chunk := read(fd, n):
+                        update(chunk)
+                        if len(chunk) < n:
+                            break
+                        n = HASH_CHUNK_SIZE
+                    return hasher.hexdigest()
+
+                if size > 4 * HASH_CHUNK_SIZE:
+                    try:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                                mm.madvise(mmap.MADV_SEQUENTIAL)
+                            hasher = _new_hasher()
+                            hasher.update(mm)
+                            return hasher.hexdigest()
+                    except (OSError, ValueError):
+                        pass  # Not mappable (e.g., special files), read it instead
+
+                    hasher = _new_hasher()
+                    update = hasher.update
+                    for chunk in _read_chunks_pipelined(f, HASH_CHUNK_SIZE):
+                        update(chunk)
+                    return hasher.hexdigest()
+
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(f, _new_hasher).hexdigest()
+
+                # Reuse a single buffer instead of allocating a new bytes object per chunk
+                hasher = _new_hasher()
+                buf = memoryview(bytearray(HASH_CHUNK_SIZE))
+                readinto, update = f.readinto, hasher.update
+                while n := readinto(buf):
+                    update(buf[:n])
+                return hasher.hexdigest()
+        except Exception as e:
+            self.log(f"[!] Error hashing {path}: {e}", 0, Colors.RED)
+            return None
+
+    def get_block_hashes(self, path, known_blocks=()):
+        """
+        Calculates the hashes of a file's blocks of `HASH_CHUNK_SIZE` bytes.
+
+        This is used for append-only files (see `APPEND_ONLY_SUFFIXES`). The
+        first `len(known_blocks)` blocks are taken from a previous scan and are
+        not read again, so only the data appended since then is hashed. Reads
+        overlap with hashing via a background reader thread.
+
+        Parameters
+        ----------
+        path : str
+            The full path to the file.
+        known_blocks : list of str, optional
+            Hashes of leading blocks that are known to be unchanged.
+
+        Returns
+        -------
+        list of str or None
+            The hexadecimal hashes of all blocks of the file, or None if an
+            error occurred (e.g., file not found or permission denied).
+        """
+        block_hashes = list(known_blocks)
+        try:
+            # Buffered reads always fill a whole block before EOF, keeping blocks aligned
             with open(path, 'rb') as f:
-                while chunk := f.read(HASH_CHUNK_SIZE):
-                    sha256.update(chunk)
-            return sha256.hexdigest()
+                f.seek(len(block_hashes) * HASH_CHUNK_SIZE)
+                new_hash, append = _new_hasher, block_hashes.append
+                for chunk in _read_chunks_pipelined(f, HASH_CHUNK_SIZE):
+                    block = new_hash()
+                    block.update(chunk)
+                    append(block.hexdigest())
+            return block_hashes
         except Exception as e:
             self.log(f"[!] Error hashing {path}: {e}", 0, Colors.RED)
             return None
 
+    def compute_hash(self, path, known_blocks=None):
+        """
+        Calculates the hash of a file that has no valid cached hash.
+
+        Parameters
+        ----------
+        path : str
+            The full path to the file.
+        known_blocks : list of str, optional
+            If given, the file is treated as append-only: it is hashed block
+            by block via `get_block_hashes`, reusing these leading blocks, and
+            its hash is the Merkle root of the block hashes.
+
+        Returns
+        -------
+        tuple
+            A `(hash, block_hashes)` tuple. `block_hashes` is None for files
+            hashed as a whole, and `hash` is None if hashing failed.
+        """
+        if known_blocks is None:
+            return self.get_file_hash(path), None
+
+        block_hashes = self.get_block_hashes(path, known_blocks)
+        if block_hashes is None:
+            return None, None
+        return _merkle_root(block_hashes), block_hashes
+
     def load_hash_db(self, db_path):
         """
-        Loads the hash database from a JSON file.
+        Loads the hash database from a JSON Lines file.
+
+        The first line is a header recording the hash algorithm, and every
+        following line holds the entry of one file, so the database is parsed
+        one record at a time (with `orjson` when it is installed). A database
+        built with a different hash algorithm than `HASH_ALGO` is discarded,
+        since its hashes cannot be compared with freshly computed ones.
+
+        Databases written by older versions are single JSON documents and are
+        still read. The oldest ones have no header and map paths directly to
+        SHA-256 hashes; those entries are migrated to the current schema with
+        an unknown modification time and size, so the files are re-hashed once.
 
         Parameters
         ----------
@@ -131,14 +514,40 @@ class FileSync:
         Returns
         -------
         dict
-            A dictionary containing file paths and their hashes. Returns an
-            empty dictionary if the file does not exist or is invalid.
+            A dictionary mapping relative file paths to entries with the
+            `mtime_ns`, `size` and `hash` of each file (plus `block_size` and
+            `block_hashes` for append-only files). Returns an empty
+            dictionary if the file does not exist or is invalid.
         """
         if os.path.exists(db_path):
             try:
-                with open(db_path, 'r') as f:
-                    return json.load(f)
-            except (IOError, json.JSONDecodeError):
+                with open(db_path, 'rb') as f:
+                    first_line = f.readline()
+                    try:
+                        header = _json_loads(first_line)
+                    except ValueError:
+                        header = None  # Not JSON Lines, e.g. an indented legacy DB
+
+                    if isinstance(header, dict) and set(header) == {'algorithm'}:
+                        algorithm = header['algorithm']
+                        entries = _read_db_records(f)
+                    else:
+                        db = _json_loads(first_line + f.read())
+                        if isinstance(db, dict) and set(db) == {'algorithm', 'files'}:
+                            algorithm, db = db['algorithm'], db['files']
+                        else:
+                            algorithm = 'sha256'  # The oldest DBs have no header
+                        if not isinstance(db, dict):
+                            raise ValueError("DB is not a JSON object")
+                        entries = db.items()
+
+                    if algorithm != HASH_ALGO:
+                        self.log(f"[!] DB file {db_path} holds {algorithm} hashes, but {HASH_ALGO} "
+                                 "is configured. Creating new one.", 1, Colors.YELLOW)
+                        return {}
+
+                    return {rel_path: _db_entry(entry) for rel_path, entry in entries}
+            except (IOError, ValueError, KeyError, TypeError):
                 self.log(f"[!] Invalid or corrupted DB file: {db_path}. Creating new one.",
                          1, Colors.YELLOW)
                 return {}
@@ -146,25 +555,91 @@ class FileSync:
 
     def save_hash_db(self, db_path, db):
         """
-        Saves the hash database dictionary to a JSON file.
+        Saves the hash database dictionary to a JSON Lines file.
+
+        A header line recording `HASH_ALGO` is followed by one compact line
+        per file (serialized with `orjson` when installed). Lines are streamed
+        to a temporary file, which is fsynced and then atomically renamed over
+        the old database, so the whole database is never held in memory as one
+        string and a crash never leaves a truncated DB behind. Files whose
+        hash could not be computed are left out, so they are hashed again on
+        the next run.
 
         Parameters
         ----------
         db_path : str
             The full path where the hash database should be saved.
         db : dict
-            The dictionary containing file paths and their hashes.
+            The dictionary mapping file paths to their `mtime_ns`, `size`
+            and `hash`.
         """
-        with open(db_path, 'w') as f:
-            json.dump(db, f, indent=2)
+        tmp_path = db_path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps({'algorithm': HASH_ALGO}) + b'\n')
+                f.writelines(_json_dumps({'path': rel_path, **entry}) + b'\n'
+                             for rel_path, entry in db.items()
+                             if entry['hash'] is not None)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, db_path)
+        finally:
+            # Only left behind if writing failed; never leave it in the synced tree
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def walk_folder(self, path):
+        """
+        Recursively yields every file below a directory using `os.scandir`.
+
+        `DirEntry` objects carry the file type from the directory read, so
+        no extra syscall is needed to tell files from directories. Ignored
+        directories are pruned before descending, and symlinked directories
+        are not followed (matching `os.walk`).
+
+        Parameters
+        ----------
+        path : str
+            The path to the directory to walk.
 
-    def scan_folder(self, folder, hash_db, tag):
+        Yields
+        ------
+        os.DirEntry
+            An entry for each file. Callers stat it only when they need to,
+            and `DirEntry` caches the result.
+        """
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return  # Unreadable directories are skipped, as os.walk does
+
+        ignored, skip_hidden = IGNORED_DIRS, IGNORE_HIDDEN_DIRS
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if is_dir:
+                name = entry.name
+                if (name not in ignored and not (skip_hidden and name.startswith('.'))
+                        and not entry.is_symlink()):
+                    yield from self.walk_folder(entry.path)
+                continue
+
+            yield entry
+
+    def scan_folder(self, folder, hash_db, tag, trust_db=False):
         """
         Scans a directory to build a dictionary of files and their hashes.
 
         This method checks the provided `hash_db` first to see if a hash for
-        a file is already known. If the file is unchanged, the cached hash is
-        reused, speeding up the scan process.
+        a file is already known. If the file's modification time and size
+        still match the cached entry, the cached hash is reused, speeding up
+        the scan process. All other files are left unhashed and returned as
+        pending, to be hashed by `hash_pending`. With `trust_db`, files listed
+        in `hash_db` are taken from it as is, without even a `stat` call.
 
         Parameters
         ----------
@@ -174,40 +649,161 @@ class FileSync:
             The hash database for the folder being scanned.
         tag : str
             A descriptive tag (e.g., 'src' or 'dest') for logging purposes.
+        trust_db : bool, optional
+            If True, assume files listed in `hash_db` are unchanged. Only
+            safe for directories nothing else writes to. Defaults to False.
 
         Returns
         -------
-        dict
-            A dictionary where keys are relative file paths and values are
-            dictionaries containing the file's full path and hash.
+        tuple
+            A tuple containing:
+            - A dictionary where keys are relative file paths and values are
+              dictionaries containing the file's hash, modification time
+              (`mtime_ns`) and size, plus `block_size` and `block_hashes` for
+              append-only files, i.e. the same schema as the hash database.
+              Full paths are not stored; join `folder` with the relative path
+              where one is needed.
+            - A list of the files that still need hashing, as `(rel_path,
+              full_path, known_blocks)` tuples. Their `hash` is None until
+              `hash_pending` runs; `known_blocks` is None unless the file is
+              append-only.
         """
         files = {}
-        for root, dirs, filenames in os.walk(folder):
-            # Filter out ignored directories in-place to prevent os.walk from descending into them
-            dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
-            
-            for filename in filenames:
-                if filename == HASH_DB_FILENAME:
-                    continue  # Skip our own db file
-                full_path = os.path.join(root, filename)
-                rel_path = os.path.relpath(full_path, folder)
-
-                # Reuse cached hash if it exists
-                file_hash = hash_db.get(rel_path)
-                if not file_hash:
-                    file_hash = self.get_file_hash(full_path)
-
-                files[rel_path] = {
-                    'full_path': full_path,
-                    'hash': file_hash
-                }
-                self.log(f"[scan {tag}] {rel_path}", 2, Colors.CYAN)
-        return files
+        uncached = []
+        db_names = {HASH_DB_FILENAME, HASH_DB_FILENAME + '.tmp'}
+        # Locals avoid repeated global/attribute lookups in the per-file loop
+        append_only, block_size = APPEND_ONLY_SUFFIXES, HASH_CHUNK_SIZE
+        hget, queue_hash = hash_db.get, uncached.append
+        log, show_files = self.log, self.verbosity >= 2
+        # Entry paths all start with this prefix, so slicing replaces os.path.relpath
+        prefix_len = len(os.path.join(folder, ''))
+        for entry in self.walk_folder(folder):
+            filename, full_path = entry.name, entry.path
+            if filename in db_names:
+                continue  # Skip our own db file (and a temp file left by an interrupted save)
+            rel_path = full_path[prefix_len:]
+
+            cached = hget(rel_path)
+            if trust_db and cached and cached['hash'] is not None:
+                files[rel_path] = cached
+                if show_files:
+                    log(f"[scan {tag}] {rel_path}", 2, Colors.CYAN)
+                continue
+
+            try:
+                st = entry.stat()
+            except OSError:
+                st = None  # E.g., a dangling symlink
+            mtime_ns, size = (st.st_mtime_ns, st.st_size) if st else (None, None)
+
+            info = files[rel_path] = {
+                'hash': None,
+                'mtime_ns': mtime_ns,
+                'size': size
+            }
+
+            # Reuse the cached hash only if the file is unchanged since it was hashed
+            if (st and cached and cached['hash'] is not None
+                    and cached['mtime_ns'] == mtime_ns and cached['size'] == size):
+                info['hash'] = cached['hash']
+                if 'block_hashes' in cached:
+                    info['block_size'] = cached['block_size']
+                    info['block_hashes'] = cached['block_hashes']
+            elif filename.endswith(append_only):
+                # Blocks that were complete at the last scan are assumed unchanged
+                known_blocks = []
+                if (st and cached and cached.get('block_size') == block_size
+                        and size >= cached['size']):
+                    known_blocks = cached['block_hashes'][:cached['size'] // block_size]
+                queue_hash((rel_path, full_path, known_blocks))
+            else:
+                queue_hash((rel_path, full_path, None))
+
+            if show_files:  # Skip building the message when it would not be shown
+                log(f"[scan {tag}] {rel_path}", 2, Colors.CYAN)
+        return files, uncached
+
+    def hash_pending(self, files, pending):
+        """
+        Hashes the files left pending by `scan_folder`.
+
+        Files are hashed in parallel on a thread pool of `HASH_WORKERS`
+        threads. Append-only files that have grown only have their new blocks
+        hashed.
+
+        Parameters
+        ----------
+        files : dict
+            The scanned files, as returned by `scan_folder`. Updated in place.
+        pending : list
+            The `(rel_path, full_path, known_blocks)` tuples to hash.
+        """
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+            rel_paths, paths, known_blocks = zip(*pending)
+            results = executor.map(self.compute_hash, paths, known_blocks)
+            for rel_path, (file_hash, block_hashes) in zip(rel_paths, results):
+                files[rel_path]['hash'] = file_hash
+                if block_hashes is not None:
+                    files[rel_path]['block_size'] = HASH_CHUNK_SIZE
+                    files[rel_path]['block_hashes'] = block_hashes
+
+    def apply_quick_check(self, src_files, src_pending, dest_files, dest_pending):
+        """
+        Avoids hashing files whose counterpart has the same size and modification time.
+
+        Copies preserve modification times, so a file with the same size and
+        `mtime_ns` on both sides is near-certainly identical. If only one side
+        still needs hashing, it reuses the other side's hash; if both do, only
+        the source copy is hashed and the destination shares its hash.
+
+        Parameters
+        ----------
+        src_files, dest_files : dict
+            The scanned files of each side, as returned by `scan_folder`.
+            Reused hashes are filled in place.
+        src_pending, dest_pending : list
+            The files left pending by `scan_folder` on each side.
+
+        Returns
+        -------
+        tuple
+            The pending lists of both sides with the skipped files removed,
+            and a list of relative paths whose destination hash must be copied
+            from the source once the source has been hashed.
+        """
+        src_queued = {rel_path for rel_path, _, _ in src_pending}
+        dest_queued = {rel_path for rel_path, _, _ in dest_pending}
+        skip_src, skip_dest, shared = set(), set(), []
+        for rel_path in src_queued | dest_queued:
+            src_info, dest_info = src_files.get(rel_path), dest_files.get(rel_path)
+            if (not src_info or not dest_info or src_info['mtime_ns'] is None
+                    or src_info['mtime_ns'] != dest_info['mtime_ns']
+                    or src_info['size'] != dest_info['size']):
+                continue
+
+            if rel_path not in src_queued:
+                if src_info['hash'] is not None:
+                    _copy_hash(src_info, dest_info)
+                    skip_dest.add(rel_path)
+            elif rel_path not in dest_queued:
+                if dest_info['hash'] is not None:
+                    _copy_hash(dest_info, src_info)
+                    skip_src.add(rel_path)
+            else:
+                shared.append(rel_path)
+                skip_dest.add(rel_path)
+
+        src_pending = [item for item in src_pending if item[0] not in skip_src]
+        dest_pending = [item for item in dest_pending if item[0] not in skip_dest]
+        return src_pending, dest_pending, shared
 
     def copy_file(self, src_path, dest_path):
         """
         Copies a file from the source to the destination, creating necessary
-        directories.
+        directories. Contents are copied inside the kernel where possible and
+        metadata is preserved (see `_fast_copy`).
 
         Parameters
         ----------
@@ -217,7 +813,7 @@ class FileSync:
             The full path where the file should be copied.
         """
         os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-        shutil.copy2(src_path, dest_path)
+        _fast_copy(src_path, dest_path)
         self.log(f"[+] Copied: {src_path} -> {dest_path}", 1, Colors.GREEN)
 
     def prompt_delete(self, path):
@@ -266,27 +862,31 @@ class FileSync:
             src_root, dest_root = self.src_dir, self.dest_dir
             src_db, dest_db = self.src_hash_db, self.dest_hash_db
 
+        # --trust-db always refers to the backup (self.dest_dir), whichever side it is on
         self.log("[*] Scanning source...", 0, Colors.BLUE)
-        src_files = self.scan_folder(src_root, src_db, 'src')
+        src_files, src_pending = self.scan_folder(src_root, src_db, 'src',
+                                                  trust_db=self.trust_db and self.restore)
 
         self.log("[*] Scanning destination...", 0, Colors.BLUE)
-        dest_files = self.scan_folder(dest_root, dest_db, 'dest')
-
-        new_files, modified_files, deleted_files = [], [], []
-
-        for rel_path, src_info in src_files.items():
-            src_hash = src_info['hash']
-            if rel_path not in dest_files:
-                new_files.append(rel_path)
-            else:
-                dest_hash = dest_files[rel_path]['hash']
-                if src_hash != dest_hash:
-                    modified_files.append(rel_path)
-
-        if not self.restore:
-            for rel_path in dest_files:
-                if rel_path not in src_files:
-                    deleted_files.append(rel_path)
+        dest_files, dest_pending = self.scan_folder(dest_root, dest_db, 'dest',
+                                                    trust_db=self.trust_db and not self.restore)
+
+        shared = []
+        if self.quick_check:
+            src_pending, dest_pending, shared = self.apply_quick_check(
+                src_files, src_pending, dest_files, dest_pending)
+
+        self.hash_pending(src_files, src_pending)
+        self.hash_pending(dest_files, dest_pending)
+        for rel_path in shared:
+            _copy_hash(src_files[rel_path], dest_files[rel_path])
+
+        # Set algebra on the key views runs in C rather than in Python loops
+        src_keys, dest_keys = src_files.keys(), dest_files.keys()
+        new_files = sorted(src_keys - dest_keys)
+        modified_files = sorted(rel_path for rel_path in src_keys & dest_keys
+                                if src_files[rel_path]['hash'] != dest_files[rel_path]['hash'])
+        deleted_files = [] if self.restore else sorted(dest_keys - src_keys)
 
         summary = {
             "src_count": len(src_files),
@@ -304,7 +904,8 @@ class FileSync:
         This method first calls `scan_changes` to identify all differences,
         then prints a summary. If `scan_only` is False and the user confirms,
         it performs the necessary file copies and deletions (in BACKUP mode).
-        Finally, it updates the local hash databases.
+        Copies run in parallel on `COPY_WORKERS` threads; deletion prompts stay
+        on the main thread. Finally, it updates the local hash databases.
         """
         summary, src_files, dest_files = self.scan_changes()
 
@@ -333,28 +934,34 @@ class FileSync:
             src_root, dest_root = self.src_dir, self.dest_dir
             src_db_path, dest_db_path = self.src_db_path, self.dest_db_path
 
-        updated_src_db, updated_dest_db = {}, {}
+        changed = set(summary["new"]).union(summary["modified"])
+        copies = [(os.path.join(src_root, rel_path), os.path.join(dest_root, rel_path))
+                  for rel_path in src_files if rel_path in changed]
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+            # Consume the results so that a failed copy raises here
+            list(executor.map(lambda paths: self.copy_file(*paths), copies))
 
+        # Scanned entries already follow the DB schema, so the source DB is saved
+        # as is. The destination DB only differs in the destination files' stats.
+        updated_dest_db = {}
         for rel_path, src_info in src_files.items():
-            src_path = src_info['full_path']
-            src_hash = src_info['hash']
-            dest_path = os.path.join(dest_root, rel_path)
-
-            # Update the databases with current hashes
-            updated_src_db[rel_path] = src_hash
-            updated_dest_db[rel_path] = src_hash
+            if rel_path in changed:
+                dest_st = os.stat(os.path.join(dest_root, rel_path))
+                dest_mtime_ns, dest_size = dest_st.st_mtime_ns, dest_st.st_size
+            else:
+                dest_info = dest_files[rel_path]
+                dest_mtime_ns, dest_size = dest_info['mtime_ns'], dest_info['size']
 
-            if rel_path in summary["new"] or rel_path in summary["modified"]:
-                self.copy_file(src_path, dest_path)
+            updated_dest_db[rel_path] = dict(src_info, mtime_ns=dest_mtime_ns, size=dest_size)
 
         if not self.restore:
             for rel_path in summary["deleted"]:
                 if rel_path in dest_files:
-                    dest_path = dest_files[rel_path]['full_path']
+                    dest_path = os.path.join(dest_root, rel_path)
                     self.prompt_delete(dest_path)
 
         # Save the updated databases
-        self.save_hash_db(src_db_path, updated_src_db)
+        self.save_hash_db(src_db_path, src_files)
         self.save_hash_db(dest_db_path, updated_dest_db)
 
         self.log("\n[✓] Sync complete. Hash DBs updated.", 0, Colors.GREEN)
\ No newline at end of file
@@ -2,7 +2,7 @@ import os
 import sys
 import argparse
 from filesync.filesync_core import FileSync
-from filesync.config import Colors, DEFAULT_SRC_DIR, HASH_DB_FILENAME
+from filesync.config import Colors, DEFAULT_SRC_DIR, HASH_DB_FILENAME, QUICK_CHECK
 
 def main():
     """
@@ -17,8 +17,9 @@ def main():
         prog="main.py",
         description=(
             "Backup & Restore Tool with local hash DBs.\n\n"
-            "This program maintains SHA-256 hashes of files inside a small JSON file "
-            f"({HASH_DB_FILENAME}) stored at the root of each directory (source and destination). "
+            "This program maintains SHA-256 (or BLAKE3) hashes of files inside a JSON Lines "
+            f"file ({HASH_DB_FILENAME}: a header line, then one record per file) stored at "
+            "the root of each directory (source and destination). "
             "It uses these hashes to detect new, modified, and deleted files.\n\n"
             "Workflow:\n"
             "   • In BACKUP mode (default):\n"
@@ -33,7 +34,10 @@ def main():
             "Hash DBs:\n"
             f"   • Each directory keeps its own {HASH_DB_FILENAME}.\n"
             "   • These DBs speed up scans and reduce unnecessary hashing.\n"
-            "   • They are updated after every sync.\n"
+            "   • They are updated after every sync.\n\n"
+            "Hash algorithm:\n"
+            "   • Set FILESYNC_HASH=blake3 to use BLAKE3 (requires the blake3 package).\n"
+            "   • The default is FILESYNC_HASH=sha256.\n"
         ),
         formatter_class=argparse.RawTextHelpFormatter
     )
@@ -72,6 +76,23 @@ def main():
             "but do not copy or delete anything."
         )
     )
+    parser.add_argument(
+        "--trust-db", action="store_true",
+        help=(
+            "Trust the backup's hash DB: files it lists are assumed unchanged\n"
+            "and are not even stat'ed. Only use this if nothing else writes\n"
+            "to the destination (--dest)."
+        )
+    )
+    parser.add_argument(
+        "--quick-check", action="store_true",
+        help=(
+            "Treat files with the same size and modification time on both sides\n"
+            "as identical when one side has no cached hash (e.g. the first run\n"
+            "against an existing backup), instead of hashing them. Faster, but\n"
+            "misses changes that keep both size and modification time."
+        )
+    )
     parser.add_argument(
         "-v", "--verbose", action="count", default=0,
         help=(
@@ -83,7 +104,7 @@ def main():
 
     args = parser.parse_args()
 
-    # Validate directory paths before starting
+    # Validate the directory paths before starting
     if not os.path.isdir(args.src):
         print(f"{Colors.RED}[!] Source folder does not exist: {args.src}{Colors.RESET}")
         sys.exit(1)
@@ -98,12 +119,18 @@ def main():
     else:
         print(f"{Colors.BOLD}[=] Backing up from source: {args.src}\n  -> to backup: {args.dest}{Colors.RESET}\n")
 
-    syncer = FileSync(
-        args.src, args.dest,
-        verbosity=args.verbose,
-        restore=args.restore,
-        scan_only=args.scan
-    )
+    try:
+        syncer = FileSync(
+            args.src, args.dest,
+            verbosity=args.verbose,
+            restore=args.restore,
+            scan_only=args.scan,
+            trust_db=args.trust_db,
+            quick_check=args.quick_check or QUICK_CHECK
+        )
+    except ValueError as e:  # E.g., an unusable FILESYNC_HASH
+        print(f"{Colors.RED}[!] {e}{Colors.RESET}")
+        sys.exit(1)
     syncer.sync()
 
 if __name__ == "__main__":